@@ -6,11 +6,17 @@ from urllib.parse import urljoin, urlparse
 from pathlib import Path
 import json
 import hashlib
-from typing import List, Set, Dict, Any, Optional
+from typing import List, Set, Dict, Any, Optional, Pattern, Tuple
+from functools import lru_cache
 import re
 from tqdm import tqdm
 
 
+def compute_content_hash(text: str) -> str:
+    """Content hash used for page deduplication (md5, as in every crawler)."""
+    return hashlib.md5(text.encode()).hexdigest()
+
+
 async def fetch_url_async(session: aiohttp.ClientSession, url: str) -> Optional[Dict[str, Any]]:
     """Fetch single URL asynchronously."""
     try:
@@ -82,6 +88,8 @@ def discover_urls(base_url: str, crawl_patterns: List[str], exclude_patterns: Li
     """Discover URLs to crawl from sitemap or by following links."""
     discovered_urls = set()
     exclude_patterns = exclude_patterns or []
+    crawl_re = compile_url_patterns(tuple(crawl_patterns))
+    exclude_re = compile_url_patterns(tuple(exclude_patterns))
 
     try:
         # Try to get sitemap first
@@ -95,10 +103,10 @@ def discover_urls(base_url: str, crawl_patterns: List[str], exclude_patterns: Li
                 response = requests.get(sitemap_url, timeout=10)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.content, 'xml')
-                    for loc in soup.find_all('loc'):
-                        url = loc.get_text().strip()
-                        if should_crawl_url(url, crawl_patterns, exclude_patterns):
-                            discovered_urls.add(url)
+                    sitemap_locs = (loc.get_text().strip() for loc in soup.find_all('loc'))
+                    discovered_urls.update(
+                        url for url in sitemap_locs if _url_matches(url, crawl_re, exclude_re)
+                    )
                     break
             except:
                 continue
@@ -118,6 +126,8 @@ def crawl_by_following_links(base_url: str, crawl_patterns: List[str], exclude_p
     discovered_urls = set()
     visited_urls = set()
     urls_to_visit = [(base_url, 0)]
+    crawl_re = compile_url_patterns(tuple(crawl_patterns))
+    exclude_re = compile_url_patterns(tuple(exclude_patterns or ()))
 
     while urls_to_visit:
         current_url, depth = urls_to_visit.pop(0)
@@ -135,7 +145,7 @@ def crawl_by_following_links(base_url: str, crawl_patterns: List[str], exclude_p
             soup = BeautifulSoup(response.content, 'html.parser')
 
             # Add current URL if it matches patterns
-            if should_crawl_url(current_url, crawl_patterns, exclude_patterns):
+            if _url_matches(current_url, crawl_re, exclude_re):
                 discovered_urls.add(current_url)
 
             # Find all links
@@ -153,39 +163,51 @@ def crawl_by_following_links(base_url: str, crawl_patterns: List[str], exclude_p
     return discovered_urls
 
 
-def should_crawl_url(url: str, crawl_patterns: List[str], exclude_patterns: List[str] = None) -> bool:
-    """Check if URL should be crawled based on patterns."""
-    exclude_patterns = exclude_patterns or []
+def _glob_to_regex(pattern: str) -> str:
+    """Convert glob pattern to regex pattern."""
+    # Escape special regex characters except * and **
+    pattern = re.escape(pattern)
+
+    # Replace escaped wildcards back and convert to regex
+    # **/ matches zero or more path segments (including empty)
+    pattern = pattern.replace(r'\*\*/', '(?:.*/)?')
+    # ** alone matches everything
+    pattern = pattern.replace(r'\*\*', '.*')
+    # * matches any characters except /
+    pattern = pattern.replace(r'\*', r'[^/]*')
 
-    def glob_to_regex(pattern: str) -> str:
-        """Convert glob pattern to regex pattern."""
-        # Escape special regex characters except * and **
-        import re as regex_module
-        pattern = regex_module.escape(pattern)
+    return pattern
 
-        # Replace escaped wildcards back and convert to regex
-        # **/ matches zero or more path segments (including empty)
-        pattern = pattern.replace(r'\*\*/', '(?:.*/)?')
-        # ** alone matches everything
-        pattern = pattern.replace(r'\*\*', '.*')
-        # * matches any characters except /
-        pattern = pattern.replace(r'\*', r'[^/]*')
 
-        return '^' + pattern + '$'
+@lru_cache(maxsize=128)
+def compile_url_patterns(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """
+    Compile URL glob patterns into a single alternation regex.
 
+    Use ``fullmatch`` on the result; returns None when there are no patterns.
+    """
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{_glob_to_regex(p)})' for p in patterns))
+
+
+def _url_matches(url: str, crawl_re: Optional[Pattern[str]], exclude_re: Optional[Pattern[str]]) -> bool:
+    """Check a URL against precompiled crawl/exclude patterns."""
     # Check exclude patterns first
-    for pattern in exclude_patterns:
-        regex_pattern = glob_to_regex(pattern)
-        if re.match(regex_pattern, url):
-            return False
+    if exclude_re is not None and exclude_re.fullmatch(url):
+        return False
 
     # Check include patterns
-    for pattern in crawl_patterns:
-        regex_pattern = glob_to_regex(pattern)
-        if re.match(regex_pattern, url):
-            return True
+    return crawl_re is not None and crawl_re.fullmatch(url) is not None
+
 
-    return False
+def should_crawl_url(url: str, crawl_patterns: List[str], exclude_patterns: List[str] = None) -> bool:
+    """Check if URL should be crawled based on patterns."""
+    return _url_matches(
+        url,
+        compile_url_patterns(tuple(crawl_patterns)),
+        compile_url_patterns(tuple(exclude_patterns or ()))
+    )
 
 
 async def crawl_documentation_async(config: Dict[str, Any], max_concurrent: int = 10) -> List[Dict[str, Any]]:
@@ -231,7 +253,7 @@ async def crawl_documentation_async(config: Dict[str, Any], max_concurrent: int
                     'code_blocks': extracted['code_blocks'],
                     'headers': extracted['headers'],
                     'word_count': extracted['word_count'],
-                    'content_hash': hashlib.md5(extracted['content'].encode()).hexdigest(),
+                    'content_hash': compute_content_hash(extracted['content']),
                     'content_type': result.get('content_type', ''),
                     'crawled_at': None  # Will be set by caller
                 }
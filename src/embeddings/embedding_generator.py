@@ -6,11 +6,18 @@ import pickle
 from pathlib import Path
 import hashlib
 import json
+from functools import lru_cache
 from tqdm import tqdm
 
 
 def initialize_embedding_model(model_name: str = "sentence-transformers/all-MiniLM-L6-v2") -> SentenceTransformer:
-    """Initialize the embedding model."""
+    """Initialize the embedding model (loaded once per process and model name)."""
+    return _load_embedding_model(model_name)
+
+
+@lru_cache(maxsize=2)
+def _load_embedding_model(model_name: str) -> SentenceTransformer:
+    """Load an embedding model; cached because loading dominates startup time."""
     try:
         print(f"Loading embedding model: {model_name}")
         model = SentenceTransformer(model_name)
@@ -3,21 +3,28 @@ from chromadb.config import Settings
 from typing import List, Dict, Any, Optional, Tuple
 import uuid
 from pathlib import Path
+from functools import lru_cache
 import json
 import numpy as np
 
 
 def initialize_chroma_client(persist_directory: str) -> chromadb.PersistentClient:
-    """Initialize ChromaDB client with persistence."""
-    persist_path = Path(persist_directory)
+    """Initialize ChromaDB client with persistence (one client per directory per process)."""
+    persist_path = Path(persist_directory).resolve()
     persist_path.mkdir(parents=True, exist_ok=True)
 
+    return _open_chroma_client(str(persist_path))
+
+
+@lru_cache(maxsize=4)
+def _open_chroma_client(persist_path: str) -> chromadb.PersistentClient:
+    """Open a persistent client; cached so SQLite/HNSW segments load once."""
     settings = Settings(
-        persist_directory=str(persist_path),
+        persist_directory=persist_path,
         anonymized_telemetry=False
     )
 
-    client = chromadb.PersistentClient(path=str(persist_path), settings=settings)
+    client = chromadb.PersistentClient(path=persist_path, settings=settings)
     return client
 
 
@@ -41,9 +48,20 @@ def create_collection(client: chromadb.PersistentClient, collection_name: str, e
 def add_chunks_to_collection(
     collection: chromadb.Collection,
     chunks: List[Any],
-    batch_size: int = 100
+    batch_size: int = 5000,
+    client: Optional[chromadb.PersistentClient] = None
 ) -> None:
-    """Add document chunks to ChromaDB collection."""
+    """
+    Add document chunks to ChromaDB collection.
+
+    Chroma commits one SQLite transaction per ``add`` call, so large batches
+    amortize that overhead. The batch is clamped to the client's maximum,
+    which depends on the SQLite build and can be well below the default.
+    """
+    max_batch_size = _get_max_batch_size(client if client is not None else getattr(collection, '_client', None))
+    if max_batch_size:
+        batch_size = min(batch_size, max_batch_size)
+
     print(f"Adding {len(chunks)} chunks to collection...")
 
     for i in range(0, len(chunks), batch_size):
@@ -113,6 +131,19 @@ def add_chunks_to_collection(
     print(f"Successfully added chunks to collection")
 
 
+def _get_max_batch_size(client: Any) -> Optional[int]:
+    """Largest batch the client accepts per ``add``, or None if it can't say."""
+    if client is None:
+        return None
+
+    try:
+        if hasattr(client, 'get_max_batch_size'):
+            return int(client.get_max_batch_size())
+        return int(client.max_batch_size)  # chromadb < 0.5
+    except Exception:
+        return None
+
+
 def query_collection(
     collection: chromadb.Collection,
     query_texts: List[str],
@@ -274,7 +305,7 @@ def create_vector_store_for_target(
     collection = create_collection(client, collection_name, embedding_dim)
 
     # Add chunks
-    add_chunks_to_collection(collection, chunks)
+    add_chunks_to_collection(collection, chunks, client=client)
 
     # Print stats
     stats = get_collection_stats(collection)
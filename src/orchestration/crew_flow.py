@@ -249,7 +249,8 @@ def create_simple_crew_workflow(target_name: str, query: str, debug_mode: bool =
     grep_tool = None
     if doc_map:
         try:
-            grep_tool = GrepSearchTool(doc_map)
+            grep_index_path = Path(data_paths['processed_dir']) / f"{target_name}_grep_index.pkl"
+            grep_tool = GrepSearchTool(doc_map, cache_path=grep_index_path)
             debug_print("✅ GREP search tool initialized")
             report_status("✅ Search tools ready")
         except Exception as e:
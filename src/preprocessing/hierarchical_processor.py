@@ -15,8 +15,11 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlparse
 from collections import defaultdict
+from functools import lru_cache
 import anthropic
 import os
+import orjson
+import msgpack
 
 
 class HierarchicalDocumentProcessor:
@@ -247,7 +250,7 @@ Provide a well-structured overview that gives an AI assistant enough context to
                 )
 
                 overview = message.content[0].text.strip()
-                print(f"✅ Project overview generated ({len(overview.split())} words)")
+                print(f"✅ Project overview generated ({count_words(overview)} words)")
                 return overview
 
             except Exception as e:
@@ -263,7 +266,7 @@ Key Topics:
 
 This is an automatically generated overview. The full documentation provides detailed information on installation, usage, APIs, and examples."""
 
-        print(f"✅ Project overview generated (fallback, {len(overview.split())} words)")
+        print(f"✅ Project overview generated (fallback, {count_words(overview)} words)")
         return overview
 
     def save_artifacts(self, doc_map: Dict[str, Any], summaries: Dict[str, Dict[str, str]],
@@ -291,6 +294,11 @@ This is an automatically generated overview. The full documentation provides det
         saved_paths['doc_map'] = map_path
         print(f"  ✓ Document map: {map_path}")
 
+        # Binary copy of the document map for faster loading (JSON stays canonical)
+        msgpack_path = processed_dir / f"{self.target_name}_doc_map.msgpack"
+        msgpack_path.write_bytes(msgpack.packb(doc_map, use_bin_type=True))
+        saved_paths['doc_map_msgpack'] = msgpack_path
+
         # Save summaries
         summaries_path = processed_dir / f"{self.target_name}_summaries.json"
         with open(summaries_path, 'w', encoding='utf-8') as f:
@@ -305,6 +313,15 @@ This is an automatically generated overview. The full documentation provides det
         saved_paths['overview'] = overview_path
         print(f"  ✓ Overview: {overview_path}")
 
+        # Sidecar stats so diagnostics don't need to read the whole overview
+        overview_meta_path = processed_dir / f"{self.target_name}_overview.meta.json"
+        with open(overview_meta_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "word_count": count_words(overview),
+                "overview_size": overview_path.stat().st_size
+            }, f)
+        saved_paths['overview_meta'] = overview_meta_path
+
         # Save a combined lookup file for easy agent access
         lookup_path = processed_dir / f"{self.target_name}_lookup.json"
         lookup_data = {
@@ -355,41 +372,86 @@ This is an automatically generated overview. The full documentation provides det
         return saved_paths
 
 
+def count_words(text: str) -> int:
+    """Count whitespace-separated words in text."""
+    # str.split() runs in C and outpaces regex/finditer counting on overview-
+    # sized text, so it stays the single place word counts are computed
+    return len(text.split())
+
+
+@lru_cache(maxsize=16)
+def _read_artifact(path: str, mtime_ns: int, size: int, fmt: str) -> Any:
+    """Read and parse an artifact; mtime/size are part of the cache key."""
+    data = Path(path).read_bytes()
+    if fmt == 'text':
+        return data.decode('utf-8')
+    if fmt == 'msgpack':
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    return orjson.loads(data)
+
+
+def _load_artifact(path: Path, fmt: str = 'json') -> Any:
+    """
+    Load a processed artifact, memoized per process.
+
+    The cache is invalidated when the file's mtime or size changes. Parsed
+    objects are shared between callers, so treat them as read-only.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return _read_artifact(str(path), stat.st_mtime_ns, stat.st_size, fmt)
+
+
 def load_doc_map(target_name: str, processed_dir) -> Optional[Dict[str, Any]]:
-    """Load document map from file."""
+    """Load document map from file, preferring an up-to-date MessagePack copy."""
     processed_dir = Path(processed_dir)
     map_path = processed_dir / f"{target_name}_doc_map.json"
-    if map_path.exists():
-        with open(map_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return None
+
+    msgpack_path = processed_dir / f"{target_name}_doc_map.msgpack"
+    try:
+        if msgpack_path.stat().st_mtime_ns >= map_path.stat().st_mtime_ns:
+            return _load_artifact(msgpack_path, fmt='msgpack')
+    except FileNotFoundError:
+        pass
+
+    return _load_artifact(map_path)
 
 
 def load_summaries(target_name: str, processed_dir) -> Optional[Dict[str, Dict[str, str]]]:
     """Load document summaries from file."""
-    processed_dir = Path(processed_dir)
-    summaries_path = processed_dir / f"{target_name}_summaries.json"
-    if summaries_path.exists():
-        with open(summaries_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return None
+    return _load_artifact(Path(processed_dir) / f"{target_name}_summaries.json")
 
 
 def load_project_overview(target_name: str, processed_dir) -> Optional[str]:
     """Load project overview from file."""
+    return _load_artifact(Path(processed_dir) / f"{target_name}_overview.txt", fmt='text')
+
+
+def load_overview_word_count(target_name: str, processed_dir) -> Optional[int]:
+    """Load the overview word count, using its sidecar only while it is up to date."""
     processed_dir = Path(processed_dir)
     overview_path = processed_dir / f"{target_name}_overview.txt"
-    if overview_path.exists():
-        with open(overview_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    return None
+    meta_path = processed_dir / f"{target_name}_overview.meta.json"
+
+    try:
+        overview_stat = overview_path.stat()
+    except FileNotFoundError:
+        return None
+
+    try:
+        if meta_path.stat().st_mtime_ns >= overview_stat.st_mtime_ns:
+            meta = _load_artifact(meta_path)
+            if meta and meta.get('overview_size') == overview_stat.st_size:
+                return meta.get('word_count')
+    except FileNotFoundError:
+        pass
+
+    overview = load_project_overview(target_name, processed_dir)
+    return count_words(overview) if overview is not None else None
 
 
 def load_lookup_data(target_name: str, processed_dir) -> Optional[Dict[str, Any]]:
     """Load combined lookup data from file."""
-    processed_dir = Path(processed_dir)
-    lookup_path = processed_dir / f"{target_name}_lookup.json"
-    if lookup_path.exists():
-        with open(lookup_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return None
+    return _load_artifact(Path(processed_dir) / f"{target_name}_lookup.json")
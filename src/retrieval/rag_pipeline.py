@@ -1,4 +1,5 @@
 from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
 import re
 from embeddings.vector_store import search_similar_chunks, hybrid_search, get_relevant_context_chunks
 from embeddings.embedding_generator import initialize_embedding_model, generate_text_embedding
@@ -7,6 +8,17 @@ import chromadb
 
 def preprocess_query(query: str) -> Dict[str, Any]:
     """Preprocess user query to extract intent and keywords."""
+    # Analysis is a pure function of the text; copy the cached lists so
+    # callers can't mutate the shared cache entry
+    analysis = dict(_analyze_query(query))
+    analysis['keywords'] = list(analysis['keywords'])
+    analysis['tech_terms'] = list(analysis['tech_terms'])
+    return analysis
+
+
+@lru_cache(maxsize=1024)
+def _analyze_query(query: str) -> Dict[str, Any]:
+    """Cached query analysis backing preprocess_query."""
     query_lower = query.lower().strip()
 
     # Identify query intent
@@ -32,25 +44,34 @@ def preprocess_query(query: str) -> Dict[str, Any]:
     }
 
 
-def classify_query_intent(query: str) -> str:
-    """Classify the intent of the user query."""
-    # Define intent patterns
-    intent_patterns = {
-        'how_to': [r'how to', r'how do i', r'how can i', r'steps to', r'tutorial'],
-        'what_is': [r'what is', r'what are', r'define', r'explain', r'meaning of'],
-        'example': [r'example', r'sample', r'demo', r'show me'],
-        'troubleshoot': [r'error', r'problem', r'issue', r'not working', r'debug', r'fix'],
-        'comparison': [r'vs', r'versus', r'compare', r'difference', r'better'],
-        'api_reference': [r'function', r'method', r'class', r'parameter', r'api', r'reference'],
-        'best_practice': [r'best practice', r'recommended', r'should i', r'better way'],
-        'code_generation': [r'write code', r'generate', r'create', r'implement', r'build']
-    }
+# Intent patterns in priority order: the first intent with any match wins
+_INTENT_PATTERNS = {
+    'how_to': [r'how to', r'how do i', r'how can i', r'steps to', r'tutorial'],
+    'what_is': [r'what is', r'what are', r'define', r'explain', r'meaning of'],
+    'example': [r'example', r'sample', r'demo', r'show me'],
+    'troubleshoot': [r'error', r'problem', r'issue', r'not working', r'debug', r'fix'],
+    'comparison': [r'vs', r'versus', r'compare', r'difference', r'better'],
+    'api_reference': [r'function', r'method', r'class', r'parameter', r'api', r'reference'],
+    'best_practice': [r'best practice', r'recommended', r'should i', r'better way'],
+    'code_generation': [r'write code', r'generate', r'create', r'implement', r'build']
+}
+
+# One regex for all intents. Each branch is a lookahead over the whole query,
+# so alternation order preserves intent priority (not leftmost match) and the
+# named group that matched identifies the intent.
+_INTENT_RE = re.compile(
+    '|'.join(
+        f"(?=.*?(?P<{intent}>{'|'.join(patterns)}))"
+        for intent, patterns in _INTENT_PATTERNS.items()
+    ),
+    re.DOTALL
+)
 
-    for intent, patterns in intent_patterns.items():
-        if any(re.search(pattern, query) for pattern in patterns):
-            return intent
 
-    return 'general'
+def classify_query_intent(query: str) -> str:
+    """Classify the intent of the user query."""
+    match = _INTENT_RE.match(query)
+    return match.lastgroup if match else 'general'
 
 
 def extract_query_keywords(query: str) -> List[str]:
@@ -5,10 +5,26 @@ Provides exact keyword matching and regex search capabilities,
 complementing RAG's semantic retrieval for hybrid search.
 """
 
+import os
 import re
+import json
+import pickle
+import tempfile
+import hashlib
+from pathlib import Path
+from collections import Counter
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-from rank_bm25 import BM25Okapi
+import numpy as np
+
+
+# Attributes produced by _build_bm25_index and persisted in the index cache;
+# bump the version whenever their layout changes
+_INDEX_CACHE_VERSION = 2
+_INDEX_CACHE_FIELDS = (
+    'doc_id_list', 'doc_index', 'lowered_content', 'term_ids', 'term_offsets',
+    'postings_docs', 'postings_tf', 'avgdl', 'idf', 'length_norm'
+)
 
 
 @dataclass
@@ -27,33 +43,128 @@ class GrepMatch:
 class GrepSearchTool:
     """GREP-based search tool for exact keyword/regex matching."""
 
-    def __init__(self, doc_map: Dict[str, Any]):
+    # Okapi BM25 parameters (Pyserini's tuned defaults)
+    BM25_K1 = 0.82
+    BM25_B = 0.68
+
+    def __init__(self, doc_map: Dict[str, Any], cache_path: Optional[Path] = None):
         """
         Initialize GREP search tool.
 
         Args:
             doc_map: Document map from hierarchical processor
+            cache_path: Optional pickle file for persisting the search index
+                across runs; it is rebuilt when the doc_map changes
         """
         self.doc_map = doc_map
         self.documents = doc_map.get('documents', {})
 
-        # Build BM25 index for ranked keyword search
-        self._build_bm25_index()
+        # Build BM25 index for ranked keyword search, reusing the cache if valid
+        if cache_path is None:
+            self._build_bm25_index()
+        else:
+            cache_path = Path(cache_path)
+            doc_map_hash = hashlib.sha256(
+                json.dumps(doc_map, sort_keys=True).encode('utf-8')
+            ).hexdigest()
+
+            if not self._load_index_cache(cache_path, doc_map_hash):
+                self._build_bm25_index()
+                self._save_index_cache(cache_path, doc_map_hash)
+
+    def _index_cache_key(self, doc_map_hash: str) -> Tuple[int, str, float, float]:
+        """Key identifying the layout, doc_map and BM25 parameters of an index."""
+        return (_INDEX_CACHE_VERSION, doc_map_hash, self.BM25_K1, self.BM25_B)
+
+    def _load_index_cache(self, cache_path: Path, doc_map_hash: str) -> bool:
+        """Load a persisted search index; returns False if missing, stale or invalid."""
+        if not cache_path.exists():
+            return False
+
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+
+            if not isinstance(cached, dict) or cached.get('key') != self._index_cache_key(doc_map_hash):
+                return False
+
+            fields = {field: cached[field] for field in _INDEX_CACHE_FIELDS}
+        except Exception as e:
+            print(f"Ignoring unreadable GREP index cache {cache_path}: {e}")
+            return False
+
+        for field, value in fields.items():
+            setattr(self, field, value)
+        return True
+
+    def _save_index_cache(self, cache_path: Path, doc_map_hash: str):
+        """Persist the search index next to the doc_map artifacts."""
+        cached = {field: getattr(self, field) for field in _INDEX_CACHE_FIELDS}
+        cached['key'] = self._index_cache_key(doc_map_hash)
+
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temp file and swap it in, so concurrent writers or
+            # readers (UI process and CLI) never see a torn pickle
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except Exception as e:
+            print(f"Could not write GREP index cache {cache_path}: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def _build_bm25_index(self):
-        """Build BM25 index for ranking keyword matches."""
-        corpus = []
+        """Build a CSR-style inverted index for BM25-ranked keyword search."""
         self.doc_id_list = []
-
-        for doc_id, doc in self.documents.items():
-            content = doc.get('content', '')
-            corpus.append(content.lower().split())
+        self.lowered_content: Dict[str, str] = {}
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        doc_lengths = []
+
+        for doc_idx, (doc_id, doc) in enumerate(self.documents.items()):
+            lowered = doc.get('content', '').lower()
+            self.lowered_content[doc_id] = lowered
+            tokens = lowered.split()
             self.doc_id_list.append(doc_id)
-
-        if corpus:
-            self.bm25 = BM25Okapi(corpus)
-        else:
-            self.bm25 = None
+            doc_lengths.append(len(tokens))
+
+            for token, tf in Counter(tokens).items():
+                postings.setdefault(token, []).append((doc_idx, tf))
+
+        self.doc_index = {doc_id: idx for idx, doc_id in enumerate(self.doc_id_list)}
+
+        # Flatten postings: term i owns postings_docs/postings_tf[term_offsets[i]:term_offsets[i + 1]]
+        self.term_ids = {token: term_id for term_id, token in enumerate(postings)}
+        doc_freq = np.fromiter((len(p) for p in postings.values()), dtype=np.int64, count=len(postings))
+        self.term_offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+        np.cumsum(doc_freq, out=self.term_offsets[1:])
+        self.postings_docs = np.fromiter(
+            (doc_idx for p in postings.values() for doc_idx, _ in p),
+            dtype=np.int32, count=int(self.term_offsets[-1])
+        )
+        self.postings_tf = np.fromiter(
+            (tf for p in postings.values() for _, tf in p),
+            dtype=np.float64, count=int(self.term_offsets[-1])
+        )
+
+        num_docs = len(self.doc_id_list)
+        doc_lengths = np.asarray(doc_lengths, dtype=np.float64)
+        self.avgdl = float(doc_lengths.mean()) if num_docs and doc_lengths.any() else 1.0
+
+        # Lucene-style IDF stays positive even for terms in most documents
+        self.idf = np.log1p((num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+        # Per-document length normalization, k1 * (1 - b + b * dl / avgdl)
+        k1, b = self.BM25_K1, self.BM25_B
+        self.length_norm = k1 * (1 - b + b * doc_lengths / self.avgdl)
 
     def grep_search(
         self,
@@ -82,6 +193,7 @@ class GrepSearchTool:
         """
         # Prepare pattern
         flags = 0 if case_sensitive else re.IGNORECASE
+        needle = None
         if use_regex:
             try:
                 compiled_pattern = re.compile(pattern, flags)
@@ -92,6 +204,7 @@ class GrepSearchTool:
             # Escape special regex characters for literal matching
             escaped_pattern = re.escape(pattern)
             compiled_pattern = re.compile(escaped_pattern, flags)
+            needle = pattern if case_sensitive else pattern.lower()
 
         # Determine which documents to search
         search_docs = doc_ids if doc_ids else list(self.documents.keys())
@@ -106,33 +219,24 @@ class GrepSearchTool:
             if not content:
                 continue
 
+            # Literal patterns use str.find (CPython's two-way/BMH search),
+            # which also rejects non-matching documents without a regex scan
+            if not needle:
+                spans = (match.span() for match in compiled_pattern.finditer(content))
+            else:
+                haystack = content if case_sensitive else self.lowered_content.get(doc_id, '')
+                if len(haystack) == len(content):
+                    spans = self._iter_literal_spans(haystack, needle)
+                else:
+                    # Lowercasing changed the length, so offsets would not line up
+                    spans = (match.span() for match in compiled_pattern.finditer(content))
+
             # Find all matches in this document
             doc_matches = []
-            for match in compiled_pattern.finditer(content):
-                start_pos = match.start()
-                end_pos = match.end()
-
-                # Extract context
-                context_start = max(0, start_pos - context_chars)
-                context_end = min(len(content), end_pos + context_chars)
-
-                context_before = content[context_start:start_pos]
-                match_text = content[start_pos:end_pos]
-                context_after = content[end_pos:context_end]
-
-                # Clean up context (remove excessive whitespace)
-                context_before = ' '.join(context_before.split())
-                context_after = ' '.join(context_after.split())
-
-                grep_match = GrepMatch(
-                    doc_id=doc_id,
-                    doc_title=doc.get('title', 'Untitled'),
-                    doc_url=doc.get('url', ''),
-                    match_text=match_text,
-                    context_before=context_before,
-                    context_after=context_after
+            for start_pos, end_pos in spans:
+                doc_matches.append(
+                    self._build_match(doc_id, doc, content, start_pos, end_pos, context_chars)
                 )
-                doc_matches.append(grep_match)
 
                 if len(doc_matches) >= max_matches_per_doc:
                     break
@@ -144,6 +248,109 @@ class GrepSearchTool:
 
         return matches[:max_total_matches]
 
+    def multi_grep(
+        self,
+        queries: List[str],
+        doc_ids: Optional[List[str]] = None,
+        context_chars: int = 100,
+        max_matches_per_doc: int = 5,
+        max_total_matches: int = 20
+    ) -> Dict[str, List[GrepMatch]]:
+        """
+        Case-insensitive literal search for several queries in one document pass.
+
+        Each document is visited once and every query still pending is
+        searched in its cached lowercased content. Per query, the results
+        match grep_search(query, case_sensitive=False) with the same limits.
+
+        Args:
+            queries: Literal search strings
+            doc_ids: Optional list of doc_ids to search (if None, searches all)
+            context_chars: Number of characters to include before/after match
+            max_matches_per_doc: Maximum matches per query per document
+            max_total_matches: Maximum total matches per query
+
+        Returns:
+            Dict mapping each query to its list of GrepMatch objects
+        """
+        results: Dict[str, List[GrepMatch]] = {query: [] for query in queries}
+        pending = {query: query.lower() for query in results if query}
+
+        search_docs = doc_ids if doc_ids else list(self.documents.keys())
+
+        for doc_id in search_docs:
+            if not pending:
+                break
+            if doc_id not in self.documents:
+                continue
+
+            doc = self.documents[doc_id]
+            content = doc.get('content', '')
+            if not content:
+                continue
+
+            haystack = self.lowered_content.get(doc_id, '')
+            aligned = len(haystack) == len(content)
+
+            for query, needle in list(pending.items()):
+                if aligned:
+                    spans = self._iter_literal_spans(haystack, needle)
+                else:
+                    # Lowercasing changed the length, so offsets would not line up
+                    spans = (
+                        match.span()
+                        for match in re.finditer(re.escape(query), content, re.IGNORECASE)
+                    )
+
+                query_matches = results[query]
+                for count, (start_pos, end_pos) in enumerate(spans, 1):
+                    query_matches.append(
+                        self._build_match(doc_id, doc, content, start_pos, end_pos, context_chars)
+                    )
+                    if count >= max_matches_per_doc:
+                        break
+
+                if len(query_matches) >= max_total_matches:
+                    del query_matches[max_total_matches:]
+                    del pending[query]
+
+        return results
+
+    @staticmethod
+    def _build_match(
+        doc_id: str,
+        doc: Dict[str, Any],
+        content: str,
+        start_pos: int,
+        end_pos: int,
+        context_chars: int
+    ) -> GrepMatch:
+        """Build a GrepMatch with whitespace-collapsed context around a span."""
+        context_start = max(0, start_pos - context_chars)
+        context_end = min(len(content), end_pos + context_chars)
+
+        # Clean up context (remove excessive whitespace)
+        context_before = ' '.join(content[context_start:start_pos].split())
+        context_after = ' '.join(content[end_pos:context_end].split())
+
+        return GrepMatch(
+            doc_id=doc_id,
+            doc_title=doc.get('title', 'Untitled'),
+            doc_url=doc.get('url', ''),
+            match_text=content[start_pos:end_pos],
+            context_before=context_before,
+            context_after=context_after
+        )
+
+    @staticmethod
+    def _iter_literal_spans(haystack: str, needle: str):
+        """Yield non-overlapping (start, end) spans of needle in haystack."""
+        step = len(needle)
+        pos = haystack.find(needle)
+        while pos != -1:
+            yield pos, pos + step
+            pos = haystack.find(needle, pos + step)
+
     def keyword_search_ranked(
         self,
         query: str,
@@ -161,29 +368,50 @@ class GrepSearchTool:
         Returns:
             List of (doc_id, score) tuples, sorted by relevance
         """
-        if not self.bm25:
+        if not self.doc_id_list:
             return []
 
-        # Tokenize query
-        query_tokens = query.lower().split()
+        # Accumulate BM25 contributions from each query term's postings slice;
+        # a term's postings hold each document once, so fancy-index += is safe
+        k1_plus_1 = self.BM25_K1 + 1
+        scores = np.zeros(len(self.doc_id_list), dtype=np.float64)
+
+        for token in query.lower().split():
+            term_id = self.term_ids.get(token)
+            if term_id is None:
+                continue
 
-        # Get BM25 scores for all documents
-        scores = self.bm25.get_scores(query_tokens)
+            start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+            docs = self.postings_docs[start:end]
+            tf = self.postings_tf[start:end]
+            scores[docs] += self.idf[term_id] * tf * k1_plus_1 / (tf + self.length_norm[docs])
 
-        # Filter by doc_ids if specified
+        # Candidates are documents that matched at least one term
+        # (kept in ascending index order, so ties follow doc_id_list order)
         if doc_ids:
-            doc_id_set = set(doc_ids)
-            results = [
-                (doc_id, score)
-                for doc_id, score in zip(self.doc_id_list, scores)
-                if doc_id in doc_id_set
-            ]
+            allowed = np.unique(np.fromiter(
+                (self.doc_index[d] for d in doc_ids if d in self.doc_index), dtype=np.int64
+            ))
+            candidates = allowed[scores[allowed] > 0]
         else:
-            results = list(zip(self.doc_id_list, scores))
+            candidates = np.flatnonzero(scores)
 
-        # Sort by score and return top_k
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        if top_k <= 0 or candidates.size == 0:
+            return []
+
+        # Select top_k with a partial sort: everything above the k-th best
+        # score, then ties at that score in index order
+        if candidates.size > top_k:
+            candidate_scores = scores[candidates]
+            threshold = -np.partition(-candidate_scores, top_k - 1)[top_k - 1]
+            above = candidates[candidate_scores > threshold]
+            tied = candidates[candidate_scores == threshold]
+            candidates = np.concatenate((above, tied[:top_k - above.size]))
+
+        # Order winners by score, breaking ties by index
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+        return [(self.doc_id_list[idx], float(scores[idx])) for idx in candidates]
 
     def find_code_examples(
         self,
@@ -205,7 +433,7 @@ class GrepSearchTool:
         search_docs = doc_ids if doc_ids else list(self.documents.keys())
 
         examples = []
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
+        needle = keyword.lower()
 
         for doc_id in search_docs:
             if doc_id not in self.documents:
@@ -215,7 +443,7 @@ class GrepSearchTool:
             code_blocks = doc.get('code_blocks', [])
 
             for code in code_blocks:
-                if pattern.search(code):
+                if needle in code.lower():
                     examples.append({
                         'doc_id': doc_id,
                         'doc_title': doc.get('title', 'Untitled'),
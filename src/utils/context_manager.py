@@ -8,6 +8,9 @@ they're working with.
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+_CTX_PRE = "\n## PROJECT CONTEXT\n\n"
+_CTX_POST = "\n\n---\n\n"
+
 
 class ProjectContextManager:
     """Manages project overview context for agents."""
@@ -24,6 +27,7 @@ class ProjectContextManager:
         self.processed_dir = processed_dir
         self.overview = None
         self._load_overview()
+        self._context_prefix = _CTX_PRE + self.overview + _CTX_POST if self.overview else ""
 
     def _load_overview(self):
         """Load project overview from file."""
@@ -44,17 +48,7 @@ class ProjectContextManager:
 
         This should be prepended to agent backstories to provide project context.
         """
-        if not self.overview:
-            return ""
-
-        return f"""
-## PROJECT CONTEXT
-
-{self.overview}
-
----
-
-"""
+        return self._context_prefix
 
     def enhance_agent_backstory(self, backstory: str) -> str:
         """
@@ -109,19 +103,19 @@ def inject_context_into_agents(
         context_manager: Project context manager
 
     Returns:
-        Enhanced agent configurations with context
+        Enhanced agent configurations with context. Agents without a backstory
+        are passed through by reference, so treat the result as read-only.
     """
     enhanced_config = {}
 
     for agent_name, agent_cfg in agents_config.items():
-        enhanced_cfg = agent_cfg.copy()
-
-        # Enhance backstory if present
-        if 'backstory' in enhanced_cfg:
-            enhanced_cfg['backstory'] = context_manager.enhance_agent_backstory(
-                enhanced_cfg['backstory']
-            )
-
-        enhanced_config[agent_name] = enhanced_cfg
+        # Enhance backstory if present; otherwise no copy is needed
+        if 'backstory' in agent_cfg:
+            enhanced_config[agent_name] = {
+                **agent_cfg,
+                'backstory': context_manager.enhance_agent_backstory(agent_cfg['backstory'])
+            }
+        else:
+            enhanced_config[agent_name] = agent_cfg
 
     return enhanced_config
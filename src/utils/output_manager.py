@@ -12,12 +12,15 @@ In production mode:
 """
 
 import sys
+import time
+import logging
 from pathlib import Path
-from datetime import datetime
 from typing import Optional, TextIO
 from contextlib import contextmanager
 import io
 
+_SEPARATOR = "=" * 80
+
 
 class OutputManager:
     """Manages output routing between debug and production modes."""
@@ -38,22 +41,27 @@ class OutputManager:
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
 
-        # Create log directory if in production mode
+        self._start_time = time.localtime()
+
+        # Reserve a log file path in production mode; the file itself is
+        # opened lazily on first write so runs with no debug output stay cheap
         if not debug_mode:
-            self.log_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = time.strftime("%Y%m%d_%H%M%S", self._start_time)
+            self.log_file_path = self.log_dir / f"cudabot_{timestamp}.log"
 
-            # Create log file with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_path = self.log_dir / f"cudabot_{timestamp}.log"
-            self.log_file_path = log_path  # Save the path
-            self.log_file = open(log_path, 'w', encoding='utf-8')
+    def _ensure_log_file(self) -> Optional[TextIO]:
+        """Open the log file and write its header on first use."""
+        if self.log_file is None and self.log_file_path is not None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self.log_file = open(self.log_file_path, 'w', encoding='utf-8')
 
             # Write header to log file
-            self.log_file.write(f"CUDA-Q Bot Debug Log\n")
-            self.log_file.write(f"Started: {datetime.now().isoformat()}\n")
-            self.log_file.write("=" * 80 + "\n\n")
+            started = time.strftime('%Y-%m-%dT%H:%M:%S', self._start_time)
+            self.log_file.write(f"CUDA-Q Bot Debug Log\nStarted: {started}\n{_SEPARATOR}\n\n")
             self.log_file.flush()
 
+        return self.log_file
+
     def debug_print(self, message: str, end: str = "\n"):
         """
         Print a debug message.
@@ -64,7 +72,7 @@ class OutputManager:
         if self.debug_mode:
             print(message, end=end)
         else:
-            if self.log_file:
+            if self._ensure_log_file():
                 self.log_file.write(message + end)
                 self.log_file.flush()
 
@@ -77,11 +85,8 @@ class OutputManager:
         self.original_stdout.flush()
 
         # Also log it if in production mode
-        if not self.debug_mode and self.log_file:
-            self.log_file.write("\n" + "=" * 80 + "\n")
-            self.log_file.write("FINAL RESPONSE:\n")
-            self.log_file.write("=" * 80 + "\n")
-            self.log_file.write(message + end)
+        if not self.debug_mode and self._ensure_log_file():
+            self.log_file.write(f"\n{_SEPARATOR}\nFINAL RESPONSE:\n{_SEPARATOR}\n{message}{end}")
             self.log_file.flush()
 
     @contextmanager
@@ -112,8 +117,9 @@ class OutputManager:
                 def flush(self):
                     self.log_file.flush()
 
-            tee_stdout = TeeOutput(self.log_file)
-            tee_stderr = TeeOutput(self.log_file)
+            log_file = self._ensure_log_file()
+            tee_stdout = TeeOutput(log_file)
+            tee_stderr = TeeOutput(log_file)
 
             old_stdout = sys.stdout
             old_stderr = sys.stderr
@@ -136,39 +142,59 @@ class OutputManager:
     def close(self):
         """Close the log file if open."""
         if self.log_file:
-            self.log_file.write("\n" + "=" * 80 + "\n")
-            self.log_file.write(f"Completed: {datetime.now().isoformat()}\n")
+            self.log_file.write(f"\n{_SEPARATOR}\nCompleted: {time.strftime('%Y-%m-%dT%H:%M:%S')}\n")
             self.log_file.close()
             self.log_file = None
 
 
+class OutputManagerLogHandler(logging.Handler):
+    """Routes logging records through the current global output manager."""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            debug_print(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
 # Global output manager instance
 _output_manager: Optional[OutputManager] = None
+_log_handler: Optional[OutputManagerLogHandler] = None
 
 
 def initialize_output_manager(debug_mode: bool = False, log_dir: Optional[Path] = None) -> OutputManager:
     """Initialize the global output manager."""
-    global _output_manager
+    global _output_manager, _log_handler
     _output_manager = OutputManager(debug_mode=debug_mode, log_dir=log_dir)
+
+    # Install the logging bridge once on the TargetManager logger; it always
+    # targets the current manager, so its records share the same log file.
+    # Third-party loggers and the root logger are left alone.
+    if _log_handler is None:
+        from utils import target_manager
+
+        _log_handler = OutputManagerLogHandler()
+        # Messages carry their own "Error"/"Warning" prefix, as the old prints did
+        _log_handler.setFormatter(logging.Formatter("%(message)s"))
+        target_manager.logger.addHandler(_log_handler)
+
     return _output_manager
 
 
 def get_output_manager() -> OutputManager:
     """Get the global output manager instance."""
-    global _output_manager
-    if _output_manager is None:
-        _output_manager = initialize_output_manager(debug_mode=True)
-    return _output_manager
+    return _output_manager or initialize_output_manager(debug_mode=True)
 
 
 def debug_print(message: str, end: str = "\n"):
     """Convenience function for debug printing."""
-    get_output_manager().debug_print(message, end)
+    # Read the global directly; initialize_output_manager may replace it
+    (_output_manager or get_output_manager()).debug_print(message, end)
 
 
 def final_print(message: str, end: str = "\n"):
     """Convenience function for final output printing."""
-    get_output_manager().final_print(message, end)
+    (_output_manager or get_output_manager()).final_print(message, end)
 
 
 def format_final_response(result: dict, include_header: bool = True) -> str:
@@ -2,22 +2,41 @@
 Target management utilities for handling multiple documentation targets.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 import json
 from datetime import datetime
 import shutil
+import logging
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Prefer the LibYAML-backed dumper; PyYAML builds without it only ship SafeDumper
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
 from config_loader import load_base_config, load_target_config, get_merged_config
 
+logger = logging.getLogger(__name__)
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_BASE_CONFIG_PATH = _REPO_ROOT / "config" / "base_config.yaml"
+_TARGETS_DIR = _REPO_ROOT / "config" / "targets"
+
+_REQUIRED_SECTIONS = ('target', 'documentation')
+_EXPECTED_AGENTS = ('query_agent', 'code_agent', 'validation_agent')
+
 
 class TargetManager:
     """Manager for handling multiple documentation targets."""
 
     def __init__(self):
-        self.base_config_path = Path(__file__).parent.parent.parent / "config" / "base_config.yaml"
-        self.targets_dir = Path(__file__).parent.parent.parent / "config" / "targets"
+        self.base_config_path = _BASE_CONFIG_PATH
+        self.targets_dir = _TARGETS_DIR
 
     def list_targets(self) -> List[Dict[str, Any]]:
         """List all available targets with their metadata."""
@@ -71,12 +90,12 @@ class TargetManager:
 
             # Write configuration
             with open(config_file, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(target_config, f, indent=2, default_flow_style=False)
+                yaml.dump(target_config, f, Dumper=_YamlDumper, indent=2, default_flow_style=False, sort_keys=False)
 
             return True
 
         except Exception as e:
-            print(f"Error creating target '{target_name}': {e}")
+            logger.error("Error creating target '%s': %s", target_name, e)
             return False
 
     def delete_target(self, target_name: str, confirm: bool = False) -> bool:
@@ -98,12 +117,12 @@ class TargetManager:
                 from setup_pipeline import cleanup_target_data
                 cleanup_target_data(target_name, confirm=True)
             except Exception as e:
-                print(f"Warning: Could not clean up data for {target_name}: {e}")
+                logger.warning("Warning: Could not clean up data for %s: %s", target_name, e)
 
             return True
 
         except Exception as e:
-            print(f"Error deleting target '{target_name}': {e}")
+            logger.error("Error deleting target '%s': %s", target_name, e)
             return False
 
     def clone_target(self, source_target: str, new_target: str, modifications: Optional[Dict[str, Any]] = None) -> bool:
@@ -124,69 +143,80 @@ class TargetManager:
             return self.create_target(new_target, new_config)
 
         except Exception as e:
-            print(f"Error cloning target '{source_target}' to '{new_target}': {e}")
+            logger.error("Error cloning target '%s' to '%s': %s", source_target, new_target, e)
             return False
 
+    def is_target_valid(self, target_name: str) -> bool:
+        """Check whether a target configuration is valid, stopping at the first error."""
+        # Anything validate_target would report as an error (including a
+        # malformed section such as `target:` being empty) makes this False
+        try:
+            config = load_target_config(target_name)
+            return next(self._iter_config_errors(config), None) is None
+        except Exception:
+            return False
+
+    def _iter_config_errors(self, config: Dict[str, Any]) -> Iterator[str]:
+        """Yield validation errors for a loaded target configuration."""
+        for section in _REQUIRED_SECTIONS:
+            if section not in config:
+                yield f"Missing required section: {section}"
+
+        if not config.get('target', {}).get('name'):
+            yield "Target name is required"
+
+        if not config.get('documentation', {}).get('base_url'):
+            yield "Documentation base_url is required"
+
     def validate_target(self, target_name: str) -> Dict[str, Any]:
         """Validate a target configuration."""
+        errors: List[str] = []
+        warnings: List[str] = []
+        suggestions: List[str] = []
         validation_result = {
             'is_valid': False,
-            'errors': [],
-            'warnings': [],
-            'suggestions': []
+            'errors': errors,
+            'warnings': warnings,
+            'suggestions': suggestions
         }
 
         try:
             config = load_target_config(target_name)
-
-            # Check required sections
-            required_sections = ['target', 'documentation']
-            for section in required_sections:
-                if section not in config:
-                    validation_result['errors'].append(f"Missing required section: {section}")
-
-            # Validate target section
-            target_info = config.get('target', {})
-            if not target_info.get('name'):
-                validation_result['errors'].append("Target name is required")
-
-            # Validate documentation section
             doc_config = config.get('documentation', {})
-            if not doc_config.get('base_url'):
-                validation_result['errors'].append("Documentation base_url is required")
-
             base_url = doc_config.get('base_url', '')
-            if base_url and not (base_url.startswith('http://') or base_url.startswith('https://')):
-                validation_result['warnings'].append("Documentation base_url should start with http:// or https://")
+
+            # Check required sections, target name and base_url
+            errors.extend(self._iter_config_errors(config))
+
+            if base_url and not base_url.startswith(('http://', 'https://')):
+                warnings.append("Documentation base_url should start with http:// or https://")
 
             # Check crawl patterns
-            crawl_patterns = doc_config.get('crawl_patterns', [])
-            if not crawl_patterns:
-                validation_result['warnings'].append("No crawl patterns defined - this may limit documentation discovery")
+            if not doc_config.get('crawl_patterns'):
+                warnings.append("No crawl patterns defined - this may limit documentation discovery")
 
             # Check agents configuration
-            agents_config = config.get('agents', {})
-            expected_agents = ['query_agent', 'code_agent', 'validation_agent']
-
-            for agent in expected_agents:
-                if agent not in agents_config:
-                    validation_result['warnings'].append(f"Agent '{agent}' not configured - using defaults")
+            agents = config.get('agents', {})
+            warnings.extend(
+                f"Agent '{agent}' not configured - using defaults"
+                for agent in _EXPECTED_AGENTS if agent not in agents
+            )
 
             # Check prompt templates
-            prompt_templates = config.get('prompt_templates', {})
-            if not prompt_templates:
-                validation_result['suggestions'].append("Consider adding custom prompt templates for better responses")
+            if not config.get('prompt_templates'):
+                suggestions.append("Consider adding custom prompt templates for better responses")
 
             # Overall validation
-            validation_result['is_valid'] = len(validation_result['errors']) == 0
+            is_valid = not errors
+            validation_result['is_valid'] = is_valid
 
-            if validation_result['is_valid']:
+            if is_valid:
                 validation_result['message'] = "Target configuration is valid"
             else:
-                validation_result['message'] = f"Target configuration has {len(validation_result['errors'])} errors"
+                validation_result['message'] = f"Target configuration has {len(errors)} errors"
 
         except Exception as e:
-            validation_result['errors'].append(f"Configuration loading error: {e}")
+            errors.append(f"Configuration loading error: {e}")
             validation_result['message'] = "Failed to load target configuration"
 
         return validation_result
@@ -306,7 +336,7 @@ Check for:
             config_file = export_dir / f"{target_name}_config.yaml"
 
             with open(config_file, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(config, f, indent=2, default_flow_style=False)
+                yaml.dump(config, f, Dumper=_YamlDumper, indent=2, default_flow_style=False, sort_keys=False)
 
             export_manifest = {
                 'target_name': target_name,
@@ -328,22 +358,28 @@ Check for:
                     ('embeddings', Path(data_paths['embeddings_dir']) / f"{target_name}_embedding_index.json")
                 ]
 
+                copy_jobs = []
                 for data_type, source_file in data_files:
                     if source_file.exists():
                         dest_file = export_dir / f"{target_name}_{data_type}.json"
-                        shutil.copy2(source_file, dest_file)
+                        copy_jobs.append((source_file, dest_file))
                         export_manifest['files'].append(str(dest_file.name))
 
+                self._copy_files(copy_jobs)
+
             # Create manifest
             manifest_file = export_dir / f"{target_name}_manifest.json"
-            with open(manifest_file, 'w', encoding='utf-8') as f:
-                json.dump(export_manifest, f, indent=2)
+            if orjson is not None:
+                manifest_file.write_bytes(orjson.dumps(export_manifest, option=orjson.OPT_INDENT_2))
+            else:
+                with open(manifest_file, 'w', encoding='utf-8') as f:
+                    json.dump(export_manifest, f, indent=2)
 
             print(f"Exported target '{target_name}' to {export_dir}")
             return True
 
         except Exception as e:
-            print(f"Error exporting target '{target_name}': {e}")
+            logger.error("Error exporting target '%s': %s", target_name, e)
             return False
 
     def import_target(self, import_path: str, new_name: Optional[str] = None) -> bool:
@@ -360,8 +396,11 @@ Check for:
                 raise ValueError("No manifest file found in import directory")
 
             manifest_file = manifest_files[0]
-            with open(manifest_file, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
+            if orjson is not None:
+                manifest = orjson.loads(manifest_file.read_bytes())
+            else:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
 
             original_name = manifest['target_name']
             target_name = new_name if new_name else original_name
@@ -397,26 +436,48 @@ Check for:
                     (f"{original_name}_embeddings.json", Path(data_paths['embeddings_dir']) / f"{target_name}_embedding_index.json")
                 ]
 
+                copy_jobs = []
                 for source_name, dest_path in data_mappings:
                     source_file = import_dir / source_name
                     if source_file.exists():
                         dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(source_file, dest_path)
+                        copy_jobs.append((source_file, dest_path))
+
+                self._copy_files(copy_jobs)
 
             print(f"Imported target '{target_name}' successfully")
             return True
 
         except Exception as e:
-            print(f"Error importing target: {e}")
+            logger.error("Error importing target: %s", e)
             return False
 
+    def _copy_files(self, copy_jobs: List[Tuple[Path, Path]]) -> None:
+        """Copy (source, destination) file pairs concurrently."""
+        if not copy_jobs:
+            return
+
+        # shutil.copy2 already stays kernel-side (sendfile) on Linux; running
+        # the copies in parallel overlaps their I/O instead of serializing it
+        with ThreadPoolExecutor(max_workers=min(4, len(copy_jobs))) as executor:
+            futures = [executor.submit(shutil.copy2, src, dst) for src, dst in copy_jobs]
+            for future in futures:
+                future.result()
+
     def _deep_update(self, base_dict: Dict, update_dict: Dict) -> None:
         """Deep update a dictionary with another dictionary."""
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                self._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        # Iterative worklist avoids per-level call overhead and recursion limits
+        stack = [(base_dict, update_dict)]
+
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                if isinstance(value, dict):
+                    current = base.get(key)
+                    if isinstance(current, dict):
+                        stack.append((current, value))
+                        continue
+                base[key] = value
 
     def get_target_stats(self, target_name: str) -> Dict[str, Any]:
         """Get statistics about a target."""
@@ -12,13 +12,10 @@ def test_with_openai():
     """Test the system with OpenAI API."""
     print("🧪 Testing full system with OpenAI API...")
 
-    # Load environment variables
+    # Load environment variables; values from .env override existing ones
     if os.path.exists('.env'):
-        with open('.env', 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#') and '=' in line:
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
+        from dotenv import dotenv_values
+        os.environ.update({k: v for k, v in dotenv_values('.env').items() if v is not None})
 
     # Check API key
     api_key = os.getenv('OPENAI_API_KEY')
@@ -3,22 +3,25 @@
 
 import os
 import sys
+import json
+import hashlib
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+# Replay identical prompts from disk instead of calling the API; enable with --use-cache
+USE_CACHE = '--use-cache' in sys.argv
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "openai"
+
 def test_single_query():
     """Test a single query with the full system."""
     print("🧪 Testing single query with OpenAI...")
 
-    # Load API key
+    # Load API key; values from .env override existing ones
     if os.path.exists('.env'):
-        with open('.env', 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#') and '=' in line:
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
+        from dotenv import dotenv_values
+        os.environ.update({k: v for k, v in dotenv_values('.env').items() if v is not None})
 
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
@@ -76,20 +79,34 @@ Instructions:
 - Use proper CUDA-Q syntax with @cudaq.kernel
 - Be helpful and educational"""
 
-        print("🤖 Generating response with OpenAI...")
-
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": test_query}
-            ],
-            max_tokens=600,
-            temperature=0.1
-        )
-
-        assistant_response = response.choices[0].message.content
+        model = "gpt-3.5-turbo"
+
+        # Content-addressed cache entry for this exact model + prompt pair
+        cache_key = hashlib.sha256(f"{model}|{system_prompt}|{test_query}".encode('utf-8')).hexdigest()
+        cache_path = CACHE_DIR / f"{cache_key}.json"
+
+        if USE_CACHE and cache_path.exists():
+            print("🤖 Using cached OpenAI response...")
+            assistant_response = json.loads(cache_path.read_text(encoding='utf-8'))['content']
+        else:
+            print("🤖 Generating response with OpenAI...")
+
+            # Call OpenAI API
+            response = client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": test_query}
+                ],
+                max_tokens=600,
+                temperature=0.1
+            )
+
+            assistant_response = response.choices[0].message.content
+
+            if USE_CACHE:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps({'content': assistant_response}), encoding='utf-8')
 
         print("\n" + "="*60)
         print("🤖 CUDA-Q Assistant Response:")
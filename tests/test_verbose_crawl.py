@@ -12,6 +12,20 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 async def verbose_crawl_test():
     """Test crawling with verbose output."""
+    # One pooled session for every request so TCP/TLS connections and DNS
+    # lookups to the docs host are reused between tests
+    connector = aiohttp.TCPConnector(
+        limit=50,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        keepalive_timeout=30
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await _run_crawl_tests(session)
+
+
+async def _run_crawl_tests(session):
+    """Run the verbose crawl tests over a shared session."""
     print("🧪 Testing CUDA-Q Documentation Crawling with Verbose Output")
     print("=" * 60)
 
@@ -20,23 +34,21 @@ async def verbose_crawl_test():
     # Test 1: Single page fetch
     print("\n1. 📡 Testing single page fetch...")
     try:
-        async with aiohttp.ClientSession() as session:
-            print("   - Creating session...")
-            url = 'https://nvidia.github.io/cuda-quantum/latest/'
-            print(f"   - Fetching: {url}")
-
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                print(f"   - Response status: {response.status}")
-                print(f"   - Content type: {response.headers.get('content-type')}")
-
-                if response.status == 200:
-                    content = await response.text()
-                    print(f"   - Content length: {len(content)} characters")
-                    print(f"   - Contains 'CUDA-Q': {'CUDA-Q' in content}")
-                    print("   ✅ Single page fetch successful")
-                else:
-                    print(f"   ❌ Bad response status: {response.status}")
-                    return False
+        url = 'https://nvidia.github.io/cuda-quantum/latest/'
+        print(f"   - Fetching: {url}")
+
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            print(f"   - Response status: {response.status}")
+            print(f"   - Content type: {response.headers.get('content-type')}")
+
+            if response.status == 200:
+                content = await response.text()
+                print(f"   - Content length: {len(content)} characters")
+                print(f"   - Contains 'CUDA-Q': {'CUDA-Q' in content}")
+                print("   ✅ Single page fetch successful")
+            else:
+                print(f"   ❌ Bad response status: {response.status}")
+                return False
 
     except Exception as e:
         print(f"   ❌ Error in single page fetch: {e}")
@@ -45,7 +57,7 @@ async def verbose_crawl_test():
     # Test 2: Document processing
     print("\n2. 🔄 Testing document processing...")
     try:
-        from crawlers.web_crawler import extract_text_from_html
+        from crawlers.web_crawler import extract_text_from_html, compute_content_hash
         print("   - Importing extract_text_from_html...")
 
         print("   - Processing HTML content...")
@@ -99,35 +111,45 @@ async def verbose_crawl_test():
         limited_urls = list(urls)[:3] if urls else [url]
         print(f"   - Crawling {len(limited_urls)} pages...")
 
-        documents = []
+        semaphore = asyncio.Semaphore(10)
 
-        async with aiohttp.ClientSession() as session:
-            for i, page_url in enumerate(limited_urls, 1):
+        async def fetch_one(session, i, page_url):
+            """Fetch and process one page, bounded by the semaphore."""
+            async with semaphore:
                 print(f"   - [{i}/{len(limited_urls)}] Fetching: {page_url[:60]}...")
 
                 try:
                     async with session.get(page_url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            processed = extract_text_from_html(content)
-
-                            document = {
-                                'url': page_url,
-                                'title': processed['title'],
-                                'content': processed['content'],
-                                'code_blocks': processed['code_blocks'],
-                                'headers': processed['headers'],
-                                'word_count': processed['word_count'],
-                                'content_hash': hashlib.md5(processed['content'].encode()).hexdigest(),
-                                'crawled_at': time.time()
-                            }
-                            documents.append(document)
-                            print(f"     ✅ Success: {processed['word_count']} words")
-                        else:
+                        if response.status != 200:
                             print(f"     ⚠️ Status {response.status}")
+                            return None
+
+                        content = await response.text()
+                        processed = extract_text_from_html(content)
+
+                        print(f"     ✅ Success: {processed['word_count']} words")
+                        return {
+                            'url': page_url,
+                            'title': processed['title'],
+                            'content': processed['content'],
+                            'code_blocks': processed['code_blocks'],
+                            'headers': processed['headers'],
+                            'word_count': processed['word_count'],
+                            'content_hash': compute_content_hash(processed['content']),
+                            'crawled_at': time.time()
+                        }
 
                 except Exception as e:
                     print(f"     ❌ Error: {e}")
+                    return None
+
+        # Fetch pages concurrently over the shared session (connection pool)
+        results = await asyncio.gather(
+            *[fetch_one(session, i, page_url) for i, page_url in enumerate(limited_urls, 1)],
+            return_exceptions=True
+        )
+
+        documents = [doc for doc in results if isinstance(doc, dict)]
 
         print(f"   ✅ Crawled {len(documents)} documents successfully")
 
@@ -149,6 +171,5 @@ async def verbose_crawl_test():
     return True
 
 if __name__ == "__main__":
-    import hashlib
     success = asyncio.run(verbose_crawl_test())
     print(f"\n{'✅ SUCCESS' if success else '❌ FAILED'}")
\ No newline at end of file
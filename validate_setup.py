@@ -3,11 +3,55 @@
 Simple validation script to check project structure and basic functionality.
 """
 
+import ast
 import os
 import sys
 from pathlib import Path
-import yaml
-import json
+from concurrent.futures import ThreadPoolExecutor
+
+CONFIG_FILES = [
+    "config/base_config.yaml",
+    "config/targets/cuda_q.yaml"
+]
+
+PYTHON_FILES = [
+    "src/main.py",
+    "src/config_loader.py",
+    "src/setup_pipeline.py",
+    "src/agents/query_agent.py",
+    "src/agents/code_agent.py",
+    "src/agents/validation_agent.py",
+    "src/orchestration/crew_flow.py"
+]
+
+def _prefetch_files(paths):
+    """Ask the kernel to read files ahead so later reads hit the page cache."""
+    fadvise = getattr(os, 'posix_fadvise', None)
+    if fadvise is None:
+        return
+
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue  # Reported by the check that reads it
+        try:
+            fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+def _load_yaml(file_path):
+    """Parse a YAML file straight from its bytes with the fastest safe loader."""
+    # Imported here so the structure check doesn't pay PyYAML's import cost
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("PyYAML is not installed (pip install -r requirements.txt)")
+
+    # libyaml's C loader when available; same safe semantics, much faster
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(file_path, 'rb') as f:
+        return yaml.load(f, Loader=loader)
 
 def check_project_structure():
     """Check that all required directories and files exist."""
@@ -38,16 +82,22 @@ def check_project_structure():
         "src/setup_pipeline.py"
     ]
 
-    missing_dirs = []
-    missing_files = []
+    # One scandir per distinct parent directory instead of a stat() per path
+    listings = {}
 
-    for directory in required_dirs:
-        if not Path(directory).exists():
-            missing_dirs.append(directory)
+    def _exists(path):
+        parent, name = os.path.split(path)
+        parent = parent or '.'
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = set()
+        return name in listings[parent]
 
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+    missing_dirs = [directory for directory in required_dirs if not _exists(directory)]
+    missing_files = [file_path for file_path in required_files if not _exists(file_path)]
 
     if missing_dirs:
         print(f"❌ Missing directories: {missing_dirs}")
@@ -64,15 +114,9 @@ def check_configuration():
     """Check that configuration files are valid YAML."""
     print("🔧 Checking configuration files...")
 
-    config_files = [
-        "config/base_config.yaml",
-        "config/targets/cuda_q.yaml"
-    ]
-
-    for config_file in config_files:
+    for config_file in CONFIG_FILES:
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                yaml.safe_load(f)
+            _load_yaml(config_file)
             print(f"  ✅ {config_file}")
         except Exception as e:
             print(f"  ❌ {config_file}: {e}")
@@ -85,8 +129,7 @@ def check_cuda_q_config():
     print("⚛️ Checking CUDA-Q target configuration...")
 
     try:
-        with open("config/targets/cuda_q.yaml", 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml("config/targets/cuda_q.yaml")
 
         # Check required sections
         required_sections = ['target', 'documentation', 'agents']
@@ -123,24 +166,29 @@ def check_cuda_q_config():
         print(f"  ❌ Error checking CUDA-Q config: {e}")
         return False
 
+def _read_source(file_path):
+    """Read a source file, returning the exception instead of raising it."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception as e:
+        return e
+
 def check_python_syntax():
     """Check Python syntax of main modules."""
     print("🐍 Checking Python syntax...")
 
-    python_files = [
-        "src/main.py",
-        "src/config_loader.py",
-        "src/setup_pipeline.py",
-        "src/agents/query_agent.py",
-        "src/agents/code_agent.py",
-        "src/agents/validation_agent.py",
-        "src/orchestration/crew_flow.py"
-    ]
+    # Read all files concurrently (I/O bound), then compile in order so the
+    # report and the first failure match a serial run
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sources = list(executor.map(_read_source, PYTHON_FILES))
 
-    for file_path in python_files:
+    for file_path, source in zip(PYTHON_FILES, sources):
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                compile(f.read(), file_path, 'exec')
+            if isinstance(source, Exception):
+                raise source
+            # Parse to an AST only; code generation isn't needed to find syntax errors
+            ast.parse(source, filename=file_path)
             print(f"  ✅ {file_path}")
         except SyntaxError as e:
             print(f"  ❌ {file_path}: Syntax error at line {e.lineno}: {e.msg}")
@@ -192,6 +240,9 @@ def main():
     print("🧪 Validating AI Documentation Assistant Setup")
     print("=" * 50)
 
+    # Start readahead for every file the checks will open, all at once
+    _prefetch_files(CONFIG_FILES + PYTHON_FILES)
+
     checks = [
         check_project_structure,
         check_configuration,